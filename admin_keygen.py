@@ -59,8 +59,8 @@ def generate_license_key(machine_id: str) -> str:
     # SHA-256 hash
     hash_bytes = hashlib.sha256(raw_string.encode('utf-8')).digest()
     
-    # Base32 encode
-    b32_encoded = base64.b32encode(hash_bytes).decode('utf-8')
+    # Base32 encode (20 simvol = 100 bit, yalnız ilk 13 bayt lazımdır)
+    b32_encoded = base64.b32encode(hash_bytes[:13]).decode('utf-8')
     
     # İlk 20 simvol
     license_key = b32_encoded[:20]
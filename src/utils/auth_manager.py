@@ -70,6 +70,7 @@ class AuthManager(QObject):
     DEFAULT_SESSION_TIMEOUT_MINUTES = 30
     MIN_USERNAME_LENGTH = 3
     MIN_PASSWORD_LENGTH = 6
+    BCRYPT_ROUNDS = 12
     
     def __init__(self, parent=None):
         """Initialize AuthManager (use get_instance() instead)."""
@@ -102,7 +103,7 @@ class AuthManager(QObject):
         Hash password with bcrypt.
         """
         password_bytes = password.encode('utf-8')
-        password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=12))
+        password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS))
         return password_hash.decode('utf-8'), 'bcrypt'
     
     def verify_password(self, password: str, stored_hash: str, stored_salt: str) -> bool:
@@ -8,11 +8,14 @@ Based on LICENSE_SPEC.md:
 """
 
 import hashlib
+import hmac
 import base64
+import ctypes
 import subprocess
 import platform
 import os
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 # =====================================================================
 # SECRET SALT - Loaded securely from environment variable
@@ -24,6 +27,7 @@ from typing import Optional, Tuple
 #
 # For production, set this in the deployment environment.
 # =====================================================================
+@lru_cache(maxsize=1)
 def _get_license_salt() -> str:
     """
     Get the license salt from environment variable.
@@ -31,6 +35,9 @@ def _get_license_salt() -> str:
     Security Note: The salt is NOT hardcoded to prevent unauthorized
     license key generation by anyone with source code access.
     
+    The result is cached for the process lifetime, so the salt file is
+    read (and a missing-salt warning logged) at most once.
+    
     Returns:
         The license salt from environment, or raises an error if not set.
     """
@@ -71,40 +78,59 @@ def _get_license_salt() -> str:
     # Real license keys generated with proper salt will NOT validate with this
     return "__FACEPRO_DEV_SALT_2025__"
 
-# License file location
+# License file location (tətbiq qovluğunda, import zamanı bir dəfə hesablanır)
 _LICENSE_FILE = ".license"
+_LICENSE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    _LICENSE_FILE
+)
+
+# Platforma proses boyu dəyişmir
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Konsol pəncərəsini gizlətmək üçün flags (sabitdir, bir dəfə qurulur)
+_STARTUPINFO = None
+_CREATIONFLAGS = 0
+if _IS_WINDOWS:
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _CREATIONFLAGS = subprocess.CREATE_NO_WINDOW
+
+# Açar normallaşdırması: tire və boşluq simvolları bir keçiddə silinir
+_KEY_STRIP = str.maketrans('', '', '- \t\r\n')
+
+# SetFileAttributesW atributları (attrib.exe əvəzinə birbaşa WinAPI)
+_FILE_ATTRIBUTE_HIDDEN = 0x02
+_FILE_ATTRIBUTE_NORMAL = 0x80
+
+# Oxunmuş lisenziya faylının keşi: (st_mtime_ns, st_size) dəyişməyibsə fayl yenidən oxunmur
+_license_cache = {'stat': None, 'content': None}
 
 
-def _run_command(command: str) -> str:
+def _run_command(command: List[str]) -> str:
     """
-    Skel shell komandasını işlədir.
+    Komandanı birbaşa işlədir (argv siyahısı, cmd.exe olmadan).
     """
-    # Konsol pəncərəsini gizlətmək üçün flags
-    startupinfo = None
-    if platform.system() == "Windows":
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        
     try:
         result = subprocess.run(
             command,
             capture_output=True,
             text=True,
-            shell=True,
             timeout=5,
-            startupinfo=startupinfo,
-            creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+            startupinfo=_STARTUPINFO,
+            creationflags=_CREATIONFLAGS
         )
         return result.stdout.strip()
     except Exception:
         return ""
 
+@lru_cache(maxsize=1)
 def _get_system_uuid() -> str:
     """Windows System UUID əldə edir (Ən stabil unikal ID)."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         # wmic csproduct get uuid
         try:
-            output = _run_command("wmic csproduct get uuid")
+            output = _run_command(["wmic", "csproduct", "get", "uuid"])
             # Output adətən belə olur:
             # UUID
             # 4C4C4544-0042-4410-8053-C7C04F355032
@@ -116,18 +142,23 @@ def _get_system_uuid() -> str:
             
         # Fallback: Powershell
         try:
-            ps_cmd = 'powershell -command "Get-WmiObject Win32_ComputerSystemProduct | Select-Object -ExpandProperty UUID"'
+            ps_cmd = [
+                "powershell", "-command",
+                "Get-WmiObject Win32_ComputerSystemProduct | Select-Object -ExpandProperty UUID"
+            ]
             return _run_command(ps_cmd)
         except:
             pass
             
     return "UNKNOWN_UUID"
 
+@lru_cache(maxsize=1)
 def _get_volume_serial() -> str:
     """C: diskinin serial nömrəsini alır."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         try:
-            output = _run_command("vol c:")
+            # vol cmd.exe-nin daxili komandasıdır
+            output = _run_command(["cmd", "/c", "vol", "c:"])
             # Output: Volume Serial Number is XXXX-XXXX
             if "Serial Number is" in output:
                 return output.split("Serial Number is")[-1].strip()
@@ -135,6 +166,7 @@ def _get_volume_serial() -> str:
             pass
     return "UNKNOWN_VOL"
 
+@lru_cache(maxsize=1)
 def get_machine_id() -> str:
     """
     Maşın ID-sini yaradır (Təkmilləşdirilmiş).
@@ -142,6 +174,9 @@ def get_machine_id() -> str:
     Kombinasiya: System UUID + Disk Serial (Daha stabil)
     CpuId və MotherboardId bəzən dəyişmir (Generic olur).
     
+    Nəticə proses boyu keşlənir: hardware dəyişmir, subprocess
+    çağırışları isə yalnız ilk dəfə işləyir.
+    
     Format: XXXX-XXXX-XXXX-XXXX (16 char, uppercase)
     """
     # Hardware məlumatlarını yığ
@@ -149,7 +184,8 @@ def get_machine_id() -> str:
     vol_serial = _get_volume_serial()
     
     # Əlavə təhlükəsizlik: CPU ProcessorID (fallback)
-    cpu_id = _run_command("wmic cpu get processorid")
+    # wmic yalnız Windows-da var; digər sistemlərdə nəticə onsuz da GENERIC_CPU olur
+    cpu_id = _run_command(["wmic", "cpu", "get", "processorid"]) if _IS_WINDOWS else ""
     if len(cpu_id.split('\n')) >= 2:
         cpu_id = cpu_id.split('\n')[1].strip()
     else:
@@ -171,6 +207,7 @@ def get_machine_id() -> str:
     return formatted_id
 
 
+@lru_cache(maxsize=8)
 def generate_license_key(machine_id: str, salt: Optional[str] = None) -> str:
     """
     Machine ID üçün lisenziya açarı yaradır.
@@ -192,8 +229,8 @@ def generate_license_key(machine_id: str, salt: Optional[str] = None) -> str:
     # SHA-256 hash
     hash_bytes = hashlib.sha256(raw_string.encode('utf-8')).digest()
     
-    # Base32 encode
-    b32_encoded = base64.b32encode(hash_bytes).decode('utf-8')
+    # Base32 encode (20 simvol = 100 bit, yalnız ilk 13 bayt lazımdır)
+    b32_encoded = base64.b32encode(hash_bytes[:13]).decode('utf-8')
     
     # İlk 20 simvol
     raw_key = b32_encoded[:20]
@@ -221,17 +258,16 @@ def validate_license_key(input_key: str, machine_id: Optional[str] = None) -> bo
     expected_key = generate_license_key(machine_id)
     
     # Normalize keys (remove dashes/spaces)
-    clean_input = input_key.replace("-", "").replace(" ", "").strip().upper()
-    clean_expected = expected_key.replace("-", "").replace(" ", "").strip().upper()
+    clean_input = input_key.translate(_KEY_STRIP).upper()
+    clean_expected = expected_key.translate(_KEY_STRIP)
     
-    return clean_input == clean_expected
+    # Constant-time müqayisə (bytes: daxil edilən açarda non-ASCII ola bilər)
+    return hmac.compare_digest(clean_input.encode('utf-8'), clean_expected.encode('utf-8'))
 
 
 def get_license_file_path() -> str:
     """Lisenziya faylının tam yolunu qaytarır."""
-    # Tətbiq qovluğunda
-    app_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    return os.path.join(app_dir, _LICENSE_FILE)
+    return _LICENSE_PATH
 
 
 def save_license(license_key: str) -> bool:
@@ -246,16 +282,13 @@ def save_license(license_key: str) -> bool:
     """
     try:
         license_path = get_license_file_path()
+        _license_cache['stat'] = None
         
         # Windows-da gizli fayla yazmaq problemi ola bilər.
         # Əvvəlcə gizliliyi ləğv et.
-        if os.path.exists(license_path) and platform.system() == "Windows":
+        if os.path.exists(license_path) and _IS_WINDOWS:
             try:
-                subprocess.run(
-                    f'attrib -h -r "{license_path}"',
-                    shell=True,
-                    capture_output=True
-                )
+                ctypes.windll.kernel32.SetFileAttributesW(license_path, _FILE_ATTRIBUTE_NORMAL)
             except:
                 pass
         
@@ -263,13 +296,9 @@ def save_license(license_key: str) -> bool:
             f.write(license_key.strip())
         
         # Windows-da faylı yenidən gizli et
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             try:
-                subprocess.run(
-                    f'attrib +h "{license_path}"',
-                    shell=True,
-                    capture_output=True
-                )
+                ctypes.windll.kernel32.SetFileAttributesW(license_path, _FILE_ATTRIBUTE_HIDDEN)
             except:
                 pass
         
@@ -291,11 +320,21 @@ def load_license() -> Optional[str]:
     try:
         license_path = get_license_file_path()
         
-        if not os.path.exists(license_path):
+        try:
+            st = os.stat(license_path)
+        except FileNotFoundError:
             return None
         
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == _license_cache['stat']:
+            return _license_cache['content']
+        
         with open(license_path, 'r', encoding='utf-8') as f:
-            return f.read().strip()
+            content = f.read().strip()
+        
+        _license_cache['stat'] = stat_key
+        _license_cache['content'] = content
+        return content
         
     except Exception:
         return None
@@ -346,6 +385,7 @@ def delete_license() -> bool:
     """Lisenziya faylını silir (debug/test üçün)."""
     try:
         license_path = get_license_file_path()
+        _license_cache['stat'] = None
         if os.path.exists(license_path):
             os.remove(license_path)
         return True
@@ -6,123 +6,74 @@ Fayl və konsol çıxışını dəstəkləyir.
 
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+from logging.handlers import TimedRotatingFileHandler
 
 
-class FaceProLogger:
-    """FacePro üçün xüsusi logger sinfi."""
+def _setup_file_handler(logger: logging.Logger, formatter: logging.Formatter):
+    """Fayl handler-i qurur."""
+    # Logs qovluğunu yarat
+    log_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        'data', 'logs'
+    )
+    os.makedirs(log_dir, exist_ok=True)
     
-    _instance: Optional['FaceProLogger'] = None
-    _initialized: bool = False
+    # Gündəlik log faylı: gecə yarısı facepro.log.YYYY-MM-DD kimi arxivlənir,
+    # beləliklə uzun işləyən proses də hər gün yeni fayla yazır
+    log_file = os.path.join(log_dir, 'facepro.log')
     
-    def __new__(cls):
-        """Singleton pattern - yalnız bir instance yaradılır."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    file_handler = TimedRotatingFileHandler(
+        log_file, when='midnight', backupCount=30, encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+
+
+def _setup() -> logging.Logger:
+    """'FacePro' logger-ini konfiqurasiya edir (import zamanı bir dəfə)."""
+    logger = logging.getLogger('FacePro')
+    if logger.handlers:
+        # Artıq konfiqurasiya olunub (məs. modul yenidən yüklənib)
+        return logger
     
-    def __init__(self):
-        """Logger-i konfiqurasiya edir."""
-        if FaceProLogger._initialized:
-            return
-            
-        self.logger = logging.getLogger('FacePro')
-        self.logger.setLevel(logging.DEBUG)
-        
-        # Formatter - loqların formatı
-        self.formatter = logging.Formatter(
-            '[%(asctime)s] [%(levelname)s] [%(module)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Console Handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(self.formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File Handler - logs qovluğuna yazır
-        self._setup_file_handler()
-        
-        FaceProLogger._initialized = True
-        self.logger.info("FacePro Logger initialized")
+    logger.setLevel(logging.DEBUG)
     
-    def _setup_file_handler(self):
-        """Fayl handler-i qurur."""
-        # Logs qovluğunu yarat
-        log_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            'data', 'logs'
-        )
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Gündəlik log faylı
-        log_file = os.path.join(
-            log_dir, 
-            f"facepro_{datetime.now().strftime('%Y%m%d')}.log"
-        )
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(self.formatter)
-        self.logger.addHandler(file_handler)
+    # Formatter - loqların formatı
+    formatter = logging.Formatter(
+        '[%(asctime)s] [%(levelname)s] [%(module)s] %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
     
-    def debug(self, message: str):
-        """Debug səviyyəsində log."""
-        self.logger.debug(message)
+    # Console Handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+    logger.addHandler(console_handler)
     
-    def info(self, message: str):
-        """Info səviyyəsində log."""
-        self.logger.info(message)
+    # File Handler - logs qovluğuna yazır
+    _setup_file_handler(logger, formatter)
     
-    def warning(self, message: str):
-        """Warning səviyyəsində log."""
-        self.logger.warning(message)
-    
-    def error(self, message: str):
-        """Error səviyyəsində log."""
-        self.logger.error(message)
-    
-    def critical(self, message: str):
-        """Critical səviyyəsində log."""
-        self.logger.critical(message)
-    
-    def exception(self, message: str):
-        """Exception ilə birlikdə log (traceback daxil)."""
-        self.logger.exception(message)
+    logger.info("FacePro Logger initialized")
+    return logger
 
 
-# Global logger instance
-_logger: Optional[FaceProLogger] = None
+# Global logger instance (logging.getLogger onsuz da ad üzrə singleton-dur)
+_logger: logging.Logger = _setup()
 
 
-def get_logger() -> FaceProLogger:
+def get_logger() -> logging.Logger:
     """Global logger instance-ı qaytarır."""
-    global _logger
-    if _logger is None:
-        _logger = FaceProLogger()
     return _logger
 
 
-# Sadə interfeys funksiyaları
-def debug(message: str):
-    get_logger().debug(message)
-
-def info(message: str):
-    get_logger().info(message)
-
-def warning(message: str):
-    get_logger().warning(message)
-
-def error(message: str):
-    get_logger().error(message)
-
-def critical(message: str):
-    get_logger().critical(message)
-
-def exception(message: str):
-    get_logger().exception(message)
+# Sadə interfeys funksiyaları (bound method-lar: hər log sətrində əlavə çağırış yoxdur)
+debug = _logger.debug
+info = _logger.info
+warning = _logger.warning
+error = _logger.error
+critical = _logger.critical
+exception = _logger.exception
 
 
 if __name__ == "__main__":
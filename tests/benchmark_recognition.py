@@ -1,7 +1,5 @@
 
 import time
-import numpy as np
-import cv2
 import sys
 import os
 
@@ -15,6 +13,7 @@ logger = get_logger()
 def benchmark_dlib():
     print("\n--- Benchmarking Dlib (face_recognition) ---")
     try:
+        import numpy as np
         import face_recognition
         
         # 1. Load Dummy Image (1080p)
@@ -47,6 +46,7 @@ def benchmark_dlib():
 def benchmark_insightface():
     print("\n--- Benchmarking InsightFace (ONNX) ---")
     try:
+        import numpy as np
         import insightface
         from insightface.app import FaceAnalysis
         
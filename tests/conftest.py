@@ -5,13 +5,9 @@ Shared fixtures for all tests.
 
 import pytest
 import os
-import sys
 import tempfile
 from unittest.mock import Mock, MagicMock, patch
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 
 @pytest.fixture
 def temp_db_path():
@@ -9,19 +9,24 @@ import pytest
 import os
 import sys
 import sqlite3
-import tempfile
-import shutil
 from datetime import datetime, timedelta
 import importlib.util
 
+import bcrypt
+
 # Direct import of auth_manager module to avoid PyQt6 dependency from utils/__init__.py
 def import_auth_manager():
     """Import auth_manager directly without going through utils package."""
+    # Already loaded (e.g. re-collection): reuse the module object
+    if "auth_manager" in sys.modules:
+        return sys.modules["auth_manager"]
+    
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     module_path = os.path.join(project_root, 'src', 'utils', 'auth_manager.py')
     spec = importlib.util.spec_from_file_location("auth_manager", module_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    sys.modules["auth_manager"] = module
     return module
 
 auth_module = import_auth_manager()
@@ -29,13 +34,62 @@ AuthManager = auth_module.AuthManager
 UserAccount = auth_module.UserAccount
 SessionData = auth_module.SessionData
 
+from src.core.database import db_manager as db_manager_module
+from src.core.database.db_manager import DatabaseManager
+from src.utils.audit_logger import AuditLogger
+
+
+# app_users schema expected by AppUserRepository
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS app_users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    salt TEXT NOT NULL,
+    role TEXT NOT NULL DEFAULT 'operator',
+    is_locked INTEGER DEFAULT 0,
+    lock_until TIMESTAMP,
+    failed_attempts INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+@pytest.fixture(scope="session")
+def _template_db(tmp_path_factory):
+    """
+    Schema-only template database, built once per session.
+    
+    Every test gets a page-level copy of it via the sqlite3 backup API
+    instead of re-running the DDL and migrations.
+    """
+    from migrations.runner import MigrationRunner
+    
+    template_path = str(tmp_path_factory.mktemp("auth_template") / "template.db")
+    conn = sqlite3.connect(template_path)
+    conn.executescript(_SCHEMA_SQL)
+    conn.close()
+    
+    # Remaining tables (audit_logs etc.) so DatabaseManager finds nothing pending
+    MigrationRunner(template_path).migrate()
+    
+    conn = sqlite3.connect(template_path)
+    yield conn
+    conn.close()
+
 
 class TestAuthManagerSetup:
     """Test fixture setup for AuthManager tests."""
     
+    # bcrypt hash of "password123", computed once for seeded accounts
+    _FIXED_HASH = bcrypt.hashpw(b"password123", bcrypt.gensalt(4)).decode('utf-8')
+    
     @pytest.fixture(autouse=True)
-    def setup_test_db(self, tmp_path):
+    def setup_test_db(self, tmp_path, monkeypatch, _template_db):
         """Create a temporary database for testing."""
+        # Minimum bcrypt cost: hashing is exercised, not its strength
+        monkeypatch.setattr(AuthManager, "BCRYPT_ROUNDS", 4)
+        
         # Reset singleton
         AuthManager.reset_instance()
         
@@ -44,33 +98,74 @@ class TestAuthManagerSetup:
         self.test_db_dir.mkdir(parents=True)
         self.test_db_path = self.test_db_dir / "faceguard.db"
         
-        # Create database with schema
+        # Clone the schema template
         conn = sqlite3.connect(str(self.test_db_path))
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS app_users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL UNIQUE,
-                password_hash TEXT NOT NULL,
-                salt TEXT NOT NULL,
-                role TEXT NOT NULL DEFAULT 'operator',
-                is_locked INTEGER DEFAULT 0,
-                lock_until TIMESTAMP,
-                failed_attempts INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
+        _template_db.backup(conn)
         conn.close()
         
-        # Get AuthManager instance and override db path
+        # AuthManager reaches the DB through the DatabaseManager/AuditLogger
+        # singletons, so point a fresh DatabaseManager at the test database
+        monkeypatch.setattr(db_manager_module, "get_db_path", lambda: str(self.test_db_path))
+        DatabaseManager._instance = None
+        AuditLogger._instance = None
+        
+        # Get AuthManager instance
         self.auth = AuthManager.get_instance()
-        self.auth._db_path = str(self.test_db_path)
         
         yield
         
         # Cleanup
         AuthManager.reset_instance()
+        AuditLogger._instance = None
+        if DatabaseManager._instance is not None:
+            DatabaseManager._instance.close_connection()
+            DatabaseManager._instance = None
+    
+    def _seed_account(self, username, role="admin"):
+        """
+        Insert an account with password "password123" directly into the DB.
+        
+        For tests that need an existing user but do not exercise
+        create_account itself (skips a bcrypt hash per account).
+        """
+        conn = sqlite3.connect(str(self.test_db_path))
+        cursor = conn.execute(
+            "INSERT INTO app_users (username, password_hash, salt, role) VALUES (?, ?, ?, ?)",
+            (username, self._FIXED_HASH, 'bcrypt', role)
+        )
+        conn.commit()
+        user_id = cursor.lastrowid
+        conn.close()
+        return user_id
+    
+    def _seed_accounts(self, accounts):
+        """Insert several (username, role) accounts in one executemany."""
+        conn = sqlite3.connect(str(self.test_db_path))
+        conn.executemany(
+            "INSERT INTO app_users (username, password_hash, salt, role) VALUES (?, ?, ?, ?)",
+            [(username, self._FIXED_HASH, 'bcrypt', role) for username, role in accounts]
+        )
+        conn.commit()
+        conn.close()
+    
+    def _get_id_by_role(self, role):
+        """Return the id of the first account with the given role."""
+        conn = sqlite3.connect(str(self.test_db_path))
+        row = conn.execute(
+            "SELECT id FROM app_users WHERE role = ? LIMIT 1", (role,)
+        ).fetchone()
+        conn.close()
+        return row[0] if row else None
+    
+    def _force_failed_attempts(self, username, attempts):
+        """Set the failed login counter directly (no bcrypt verifies)."""
+        conn = sqlite3.connect(str(self.test_db_path))
+        conn.execute(
+            "UPDATE app_users SET failed_attempts = ? WHERE username = ?",
+            (attempts, username)
+        )
+        conn.commit()
+        conn.close()
 
 
 class TestPasswordHashing(TestAuthManagerSetup):
@@ -179,10 +274,12 @@ class TestAccountListing(TestAuthManagerSetup):
         assert len(accounts) == 0
     
     def test_list_accounts_returns_all(self):
-        """Test that list_accounts returns all created accounts."""
-        self.auth.create_account("user1", "password123", "admin")
-        self.auth.create_account("user2", "password123", "operator")
-        self.auth.create_account("user3", "password123", "operator")
+        """Test that list_accounts returns all stored accounts."""
+        self._seed_accounts([
+            ("user1", "admin"),
+            ("user2", "operator"),
+            ("user3", "operator"),
+        ])
         
         accounts = self.auth.list_accounts()
         
@@ -198,9 +295,7 @@ class TestAccountUpdate(TestAuthManagerSetup):
     
     def test_update_account_password(self):
         """Test updating account password."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
+        user_id = self._seed_account("testuser", "admin")
         
         success, message = self.auth.update_account(user_id, password="newpassword123")
         
@@ -212,9 +307,7 @@ class TestAccountUpdate(TestAuthManagerSetup):
     
     def test_update_account_role(self):
         """Test updating account role."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
+        user_id = self._seed_account("testuser", "admin")
         
         success, message = self.auth.update_account(user_id, role="operator")
         
@@ -237,11 +330,9 @@ class TestAccountDeletion(TestAuthManagerSetup):
     
     def test_delete_account_success(self):
         """Test successful account deletion."""
-        self.auth.create_account("admin1", "password123", "admin")
-        self.auth.create_account("user1", "password123", "operator")
+        self._seed_accounts([("admin1", "admin"), ("user1", "operator")])
         
-        accounts = self.auth.list_accounts()
-        operator_id = next(a.id for a in accounts if a.role == "operator")
+        operator_id = self._get_id_by_role("operator")
         
         success, message = self.auth.delete_account(operator_id)
         
@@ -250,10 +341,7 @@ class TestAccountDeletion(TestAuthManagerSetup):
     
     def test_delete_last_admin_fails(self):
         """Test that deleting the last admin fails."""
-        self.auth.create_account("admin1", "password123", "admin")
-        
-        accounts = self.auth.list_accounts()
-        admin_id = accounts[0].id
+        admin_id = self._seed_account("admin1", "admin")
         
         success, message = self.auth.delete_account(admin_id)
         
@@ -262,11 +350,8 @@ class TestAccountDeletion(TestAuthManagerSetup):
     
     def test_delete_admin_when_multiple_admins_exist(self):
         """Test that deleting an admin succeeds when other admins exist."""
-        self.auth.create_account("admin1", "password123", "admin")
-        self.auth.create_account("admin2", "password123", "admin")
-        
-        accounts = self.auth.list_accounts()
-        first_admin_id = accounts[0].id
+        first_admin_id = self._seed_account("admin1", "admin")
+        self._seed_account("admin2", "admin")
         
         success, message = self.auth.delete_account(first_admin_id)
         
@@ -279,7 +364,7 @@ class TestAuthentication(TestAuthManagerSetup):
     
     def test_authenticate_success(self):
         """Test successful authentication."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         
         success, message = self.auth.authenticate("testuser", "password123")
         
@@ -288,7 +373,7 @@ class TestAuthentication(TestAuthManagerSetup):
     
     def test_authenticate_wrong_password(self):
         """Test authentication with wrong password fails."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         
         success, message = self.auth.authenticate("testuser", "wrongpassword")
         
@@ -308,11 +393,11 @@ class TestAccountLockout(TestAuthManagerSetup):
     
     def test_account_locks_after_max_failures(self):
         """Test that account locks after 3 failed attempts."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         
-        # Fail 3 times
-        for i in range(3):
-            success, message = self.auth.authenticate("testuser", "wrongpassword")
+        # Two earlier failures, then the third one through authenticate()
+        self._force_failed_attempts("testuser", AuthManager.MAX_FAILED_ATTEMPTS - 1)
+        success, message = self.auth.authenticate("testuser", "wrongpassword")
         
         # Should be locked now
         assert "locked" in message.lower()
@@ -324,7 +409,7 @@ class TestAccountLockout(TestAuthManagerSetup):
     
     def test_failed_attempts_reset_on_success(self):
         """Test that failed attempts reset after successful login."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         
         # Fail twice
         self.auth.authenticate("testuser", "wrongpassword")
@@ -347,7 +432,7 @@ class TestSessionManagement(TestAuthManagerSetup):
     
     def test_logout_clears_session(self):
         """Test that logout clears the session."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         self.auth.authenticate("testuser", "password123")
         
         assert self.auth.is_logged_in() is True
@@ -359,7 +444,7 @@ class TestSessionManagement(TestAuthManagerSetup):
     
     def test_get_current_user_returns_session_data(self):
         """Test that get_current_user returns correct session data."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         self.auth.authenticate("testuser", "password123")
         
         session = self.auth.get_current_user()
@@ -370,7 +455,7 @@ class TestSessionManagement(TestAuthManagerSetup):
     
     def test_logout_emits_signal(self):
         """Test that logout emits logout_requested signal."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         self.auth.authenticate("testuser", "password123")
         
         # Track signal emission
@@ -393,7 +478,7 @@ class TestSessionManagement(TestAuthManagerSetup):
     
     def test_session_timeout_check_valid_session(self):
         """Test session timeout check with valid session."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         self.auth.authenticate("testuser", "password123")
         
         # Session should be valid immediately after login
@@ -403,16 +488,22 @@ class TestSessionManagement(TestAuthManagerSetup):
         """Test session timeout check with no session."""
         assert self.auth.check_session_timeout() is False
     
-    def test_reset_activity_timer(self):
+    def test_reset_activity_timer(self, monkeypatch):
         """Test that reset_activity_timer updates last_activity."""
-        self.auth.create_account("testuser", "password123", "admin")
+        self._seed_account("testuser", "admin")
         self.auth.authenticate("testuser", "password123")
         
         original_activity = self.auth.get_current_user().last_activity
         
-        # Small delay to ensure time difference
-        import time
-        time.sleep(0.1)
+        # Advance auth_manager's clock instead of sleeping
+        later = original_activity + timedelta(seconds=1)
+        
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return later
+        
+        monkeypatch.setattr(auth_module, "datetime", FakeDatetime)
         
         self.auth.reset_activity_timer()
         
@@ -448,9 +539,7 @@ class TestPasswordChange(TestAuthManagerSetup):
     
     def test_change_password_success(self):
         """Test successful password change."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
+        user_id = self._seed_account("testuser", "admin")
         
         success, message = self.auth.change_password(user_id, "password123", "newpassword456")
         
@@ -464,9 +553,7 @@ class TestPasswordChange(TestAuthManagerSetup):
     
     def test_change_password_wrong_current_password(self):
         """Test password change fails with wrong current password."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
+        user_id = self._seed_account("testuser", "admin")
         
         success, message = self.auth.change_password(user_id, "wrongpassword", "newpassword456")
         
@@ -479,9 +566,7 @@ class TestPasswordChange(TestAuthManagerSetup):
     
     def test_change_password_short_new_password(self):
         """Test password change fails with short new password."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
+        user_id = self._seed_account("testuser", "admin")
         
         success, message = self.auth.change_password(user_id, "password123", "12345")
         
@@ -497,11 +582,8 @@ class TestPasswordChange(TestAuthManagerSetup):
     
     def test_change_password_updates_hash_and_salt(self):
         """Test that password change updates the hash (salt placeholder stays same with bcrypt)."""
-        self.auth.create_account("testuser", "password123", "admin")
-        accounts = self.auth.list_accounts()
-        user_id = accounts[0].id
-        old_hash = accounts[0].password_hash
-        old_salt = accounts[0].salt
+        user_id = self._seed_account("testuser", "admin")
+        old_hash = self._FIXED_HASH
         
         self.auth.change_password(user_id, "password123", "newpassword456")
         
@@ -521,45 +603,45 @@ class TestRoleBasedAccessControl(TestAuthManagerSetup):
     
     def test_admin_can_access_settings(self):
         """Test that admin user can access settings."""
-        self.auth.create_account("admin1", "password123", "admin")
+        self._seed_account("admin1", "admin")
         self.auth.authenticate("admin1", "password123")
         
         assert self.auth.can_access_settings() is True
     
     def test_operator_cannot_access_settings(self):
         """Test that operator user cannot access settings."""
-        self.auth.create_account("admin1", "password123", "admin")
-        self.auth.create_account("operator1", "password123", "operator")
+        self._seed_account("admin1", "admin")
+        self._seed_account("operator1", "operator")
         self.auth.authenticate("operator1", "password123")
         
         assert self.auth.can_access_settings() is False
     
     def test_admin_can_manage_users(self):
         """Test that admin user can manage users."""
-        self.auth.create_account("admin1", "password123", "admin")
+        self._seed_account("admin1", "admin")
         self.auth.authenticate("admin1", "password123")
         
         assert self.auth.can_manage_users() is True
     
     def test_operator_cannot_manage_users(self):
         """Test that operator user cannot manage users."""
-        self.auth.create_account("admin1", "password123", "admin")
-        self.auth.create_account("operator1", "password123", "operator")
+        self._seed_account("admin1", "admin")
+        self._seed_account("operator1", "operator")
         self.auth.authenticate("operator1", "password123")
         
         assert self.auth.can_manage_users() is False
     
     def test_admin_can_enroll_faces(self):
         """Test that admin user can enroll faces."""
-        self.auth.create_account("admin1", "password123", "admin")
+        self._seed_account("admin1", "admin")
         self.auth.authenticate("admin1", "password123")
         
         assert self.auth.can_enroll_faces() is True
     
     def test_operator_cannot_enroll_faces(self):
         """Test that operator user cannot enroll faces."""
-        self.auth.create_account("admin1", "password123", "admin")
-        self.auth.create_account("operator1", "password123", "operator")
+        self._seed_account("admin1", "admin")
+        self._seed_account("operator1", "operator")
         self.auth.authenticate("operator1", "password123")
         
         assert self.auth.can_enroll_faces() is False
@@ -572,7 +654,7 @@ class TestRoleBasedAccessControl(TestAuthManagerSetup):
     
     def test_permissions_after_logout(self):
         """Test that permissions are denied after logout."""
-        self.auth.create_account("admin1", "password123", "admin")
+        self._seed_account("admin1", "admin")
         self.auth.authenticate("admin1", "password123")
         
         # Verify admin has permissions
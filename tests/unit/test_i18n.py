@@ -113,6 +113,18 @@ class TestI18nManager:
         result = az_camera_key if az_camera_key else en_camera_key
         assert result == 'Cannot connect to camera'
     
+    def test_translator_falls_back_to_english(self, temp_locales_dir, monkeypatch):
+        """Test that Translator resolves keys missing in az from en"""
+        from src.utils import i18n
+        monkeypatch.setattr(i18n, '_LOCALES_DIR', temp_locales_dir)
+        
+        translator = i18n.Translator()
+        translator.load_language('az')
+        
+        assert translator.tr('menu.file') == 'Fayl'
+        assert translator.tr('errors.camera_connection') == 'Cannot connect to camera'
+        assert translator.tr('nonexistent.key') == 'nonexistent.key'
+    
     def test_missing_key_placeholder(self):
         """Test that missing keys return placeholder"""
         missing_key = 'nonexistent.missing.key'
@@ -162,6 +174,28 @@ class TestTranslationValidation:
         assert 'dashboard.status' in keys
         assert '$meta' not in str(keys)  # $meta should be excluded
     
+    def test_translator_flatten_dict(self):
+        """Test that Translator flattens nested catalogs to dot keys"""
+        from src.utils.i18n import Translator
+        
+        data = {
+            "menu": {"file": "File"},
+            "dashboard": {
+                "cards": {"start": "Start"},
+                "status": "Status"
+            },
+            "version": 1
+        }
+        
+        flat = Translator()._flatten_dict(data)
+        
+        assert flat == {
+            'menu.file': 'File',
+            'dashboard.cards.start': 'Start',
+            'dashboard.status': 'Status',
+            'version': '1',
+        }
+    
     def test_missing_keys_detection(self, temp_locales_dir):
         """Test detection of missing keys between languages"""
         en_keys = {'menu.file', 'menu.view', 'errors.camera'}
@@ -218,6 +252,51 @@ class TestLegacyTranslator:
         set_language(original_lang)
         assert translator.current_language == original_lang
 
+    def test_only_requested_language_is_loaded(self):
+        """Test that locale files are loaded lazily, one language at a time"""
+        from src.utils.i18n import Translator
+        
+        translator = Translator()
+        translator.load_language('az')
+        
+        assert 'az' in translator._translations
+        assert 'ru' not in translator._translations
+    
+    def test_catalog_is_reused_when_switching_back(self):
+        """Test that each language's catalog is built only once"""
+        from src.utils.i18n import Translator
+        
+        translator = Translator()
+        translator.load_language('en')
+        en_catalog = translator._flattened_cache
+        translator.load_language('az')
+        translator.load_language('en')
+        
+        assert translator._flattened_cache is en_catalog
+    
+    def test_reloading_current_language_is_noop(self):
+        """Test that re-selecting the active language does not re-emit"""
+        from src.utils.i18n import Translator
+        
+        translator = Translator()
+        emitted = []
+        translator.language_changed.connect(emitted.append)
+        translator.load_language('az')
+        translator.load_language('az')
+        
+        assert emitted == ['az']
+    
+    def test_unsupported_language_is_ignored(self):
+        """Test that an unknown language code keeps the current language"""
+        from src.utils.i18n import Translator
+        
+        translator = Translator()
+        translator.load_language('en')
+        translator.load_language('xx')
+        
+        assert translator.current_language == 'en'
+        assert 'xx' not in translator._translations
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
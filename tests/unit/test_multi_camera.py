@@ -7,11 +7,6 @@ import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock
 
-# Test imports
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 
 class TestTrackIdNamespacing:
     """Tests for multi-camera track ID namespacing (PROD-002 Task 1.2.4)"""
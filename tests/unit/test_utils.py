@@ -17,11 +17,13 @@ class TestLoggerModule:
         assert get_logger is not None
     
     def test_get_logger_returns_facepro_logger(self):
-        """get_logger() FaceProLogger instansı qaytarmalı."""
-        from src.utils.logger import get_logger, FaceProLogger
+        """get_logger() 'FacePro' adlı logging.Logger qaytarmalı."""
+        import logging
+        from src.utils.logger import get_logger
         
         logger = get_logger()
-        assert isinstance(logger, FaceProLogger)
+        assert isinstance(logger, logging.Logger)
+        assert logger is logging.getLogger('FacePro')
     
     def test_logger_has_methods(self):
         """Logger info, error, warning metodlarına malik olmalı."""